@@ -8,10 +8,9 @@ Author: Termux Developer
 import os
 import sys
 import time
-import json
-import hashlib
-import getpass
-from datetime import datetime
+import atexit
+# json, orjson, hashlib, hmac dan getpass diimpor saat pertama dipakai
+# agar start-up lebih cepat
 
 # ======================
 # CONFIGURATION SECTION
@@ -22,6 +21,8 @@ class Config:
     LOG_FILE = "access.log"
     MAX_ATTEMPTS = 3
     SESSION_TIMEOUT = 300  # 5 menit dalam detik
+    HASH_ITERATIONS = 100_000  # Iterasi PBKDF2-HMAC-SHA256
+    SHOW_ANIMATIONS = True  # Animasi loading (hanya di terminal interaktif)
     
     # Warna terminal (ANSI codes)
     COLORS = {
@@ -35,26 +36,114 @@ class Config:
         'WHITE': '\033[1;37m'
     }
 
+# Lookup warna siap pakai (huruf besar dan kecil) untuk UIHelper
+_COLORS = {name: code for name, code in Config.COLORS.items()}
+_COLORS.update({name.lower(): code for name, code in Config.COLORS.items()})
+_RESET = Config.COLORS['RESET']
+
+# Escape ANSI untuk membersihkan layar (None di Windows, pakai 'cls')
+_CLEAR = '\x1b[H\x1b[2J\x1b[3J' if os.name != 'nt' else None
+
+# Garis pemisah
+_HR50 = "=" * 50
+_HR60 = "=" * 60
+
+# Cache timestamp terformat per detik
+_last_ts_sec = 0
+_last_ts_str = ''
+
+def _now_str():
+    """Waktu sekarang sebagai "%Y-%m-%d %H:%M:%S", diformat ulang tiap detik"""
+    global _last_ts_sec, _last_ts_str
+    sec = int(time.time())
+    if sec != _last_ts_sec:
+        _last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _last_ts_sec = sec
+    return _last_ts_str
+
+# orjson opsional: jauh lebih cepat untuk load/save users.json
+_orjson = None
+_orjson_checked = False
+
+def _json_backend():
+    """Modul orjson jika terpasang, None jika tidak (diimpor saat pertama dipakai)"""
+    global _orjson, _orjson_checked
+    if not _orjson_checked:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = None
+        _orjson_checked = True
+    return _orjson
+
 # ======================
 # DATABASE MANAGER
 # ======================
 class DatabaseManager:
     """Mengelola penyimpanan data pengguna"""
     
+    # Cache isi users.json, divalidasi ulang lewat mtime file
+    _cache = None
+    _cache_mtime = 0
+    # Indeks {username: (salt, hash)} dalam bytes, dibangun dari cache
+    _hash_index = None
+    _hash_index_src = None
+    # Salt tiruan untuk menyamakan waktu verifikasi
+    _DUMMY_SALT = bytes(16)
+    
     @staticmethod
     def load_users():
-        """Memuat data pengguna dari file JSON"""
-        if os.path.exists(Config.DB_FILE):
+        """Memuat data pengguna dari file JSON (salinan, aman diubah)"""
+        return DatabaseManager._copy_users(DatabaseManager._load_cached())
+    
+    @staticmethod
+    def _copy_users(users):
+        """Salinan per record (record berisi nilai sederhana saja)"""
+        return {
+            username: dict(record) if isinstance(record, dict) else record
+            for username, record in users.items()
+        }
+    
+    @staticmethod
+    def _load_cached():
+        """Data pengguna dari cache (jangan diubah langsung)"""
+        try:
+            st = os.stat(Config.DB_FILE)
+        except FileNotFoundError:
+            st = None
+        
+        if st is not None:
+            if (DatabaseManager._cache is not None
+                    and st.st_mtime_ns == DatabaseManager._cache_mtime):
+                return DatabaseManager._cache
+            orjson = _json_backend()
             try:
-                with open(Config.DB_FILE, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
+                if orjson is not None:
+                    with open(Config.DB_FILE, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    import json
+                    with open(Config.DB_FILE, 'r') as f:
+                        data = json.load(f)
+            except ValueError:
                 return {}
-        # Data default jika file tidak ada
+            DatabaseManager._cache = data
+            DatabaseManager._cache_mtime = st.st_mtime_ns
+            DatabaseManager._hash_index = None
+            return data
+        # File belum ada: dibuat oleh TermuxApp.init_system
+        return {}
+    
+    @staticmethod
+    def default_users():
+        """Data default (akun admin) untuk database baru"""
+        salt, password_hash = DatabaseManager.make_password("admin123")
         return {
             "admin": {
-                "password": DatabaseManager.hash_password("admin123"),
-                "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "salt": salt,
+                "password": password_hash,
+                "created": _now_str(),
                 "level": "admin"
             }
         }
@@ -62,13 +151,102 @@ class DatabaseManager:
     @staticmethod
     def save_users(users_data):
         """Menyimpan data pengguna ke file JSON"""
-        with open(Config.DB_FILE, 'w') as f:
-            json.dump(users_data, f, indent=4, sort_keys=True)
+        orjson = _json_backend()
+        if orjson is not None:
+            data = orjson.dumps(
+                users_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            )
+            with open(Config.DB_FILE, 'wb') as f:
+                f.write(data)
+                f.flush()
+                st = os.fstat(f.fileno())
+        else:
+            import json
+            data = json.dumps(users_data, indent=4, sort_keys=True)
+            with open(Config.DB_FILE, 'w') as f:
+                f.write(data)
+                f.flush()
+                st = os.fstat(f.fileno())
+        # Cache hanya diperbarui setelah file berhasil ditulis; mtime
+        # diambil dari handle sendiri agar tidak tertukar dengan proses lain
+        DatabaseManager._cache = DatabaseManager._copy_users(users_data)
+        DatabaseManager._cache_mtime = st.st_mtime_ns
+        DatabaseManager._hash_index = None
     
     @staticmethod
-    def hash_password(password):
-        """Hash password menggunakan SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def hash_index():
+        """Indeks hash password per user untuk verifikasi login"""
+        users = DatabaseManager._load_cached()
+        if (DatabaseManager._hash_index is None
+                or DatabaseManager._hash_index_src is not users):
+            index = {}
+            for username, record in users.items():
+                try:
+                    salt = record.get("salt")
+                    index[username] = (
+                        bytes.fromhex(salt) if salt is not None else None,
+                        bytes.fromhex(record["password"])
+                    )
+                except (AttributeError, KeyError, TypeError, ValueError):
+                    # Record rusak dilewati: hanya user itu yang gagal login
+                    continue
+            DatabaseManager._hash_index = index
+            DatabaseManager._hash_index_src = users
+        return DatabaseManager._hash_index
+    
+    @staticmethod
+    def derive_key(password, salt):
+        """PBKDF2-HMAC-SHA256 dalam bentuk bytes mentah"""
+        import hashlib
+        return hashlib.pbkdf2_hmac(
+            'sha256', password.encode(), salt, Config.HASH_ITERATIONS
+        )
+    
+    @staticmethod
+    def hash_password(password, salt):
+        """Hash password menggunakan PBKDF2-HMAC-SHA256"""
+        return DatabaseManager.derive_key(password, bytes.fromhex(salt)).hex()
+    
+    @staticmethod
+    def make_password(password):
+        """Membuat salt baru dan hash password, mengembalikan (salt, hash)"""
+        salt = os.urandom(16).hex()
+        return salt, DatabaseManager.hash_password(password, salt)
+    
+    @staticmethod
+    def verify_hash(salt, stored, password):
+        """Mencocokkan password dengan salt dan hash (bytes)"""
+        import hashlib
+        import hmac
+        if salt is None:
+            # Record lama: SHA-256 tanpa salt. KDF tetap dijalankan agar
+            # waktunya sama dengan record baru dan username tak dikenal
+            DatabaseManager.derive_key(password, DatabaseManager._DUMMY_SALT)
+            candidate = hashlib.sha256(password.encode()).digest()
+        else:
+            candidate = DatabaseManager.derive_key(password, salt)
+        return hmac.compare_digest(candidate, stored)
+    
+    @staticmethod
+    def verify_user(username, password):
+        """Memverifikasi login lewat indeks hash"""
+        entry = DatabaseManager.hash_index().get(username)
+        if entry is None:
+            # Tetap jalankan KDF agar waktu respon tidak membocorkan username
+            DatabaseManager.derive_key(password, DatabaseManager._DUMMY_SALT)
+            return False
+        salt, stored = entry
+        return DatabaseManager.verify_hash(salt, stored, password)
+    
+    @staticmethod
+    def verify_password(record, password):
+        """Mencocokkan password dengan record user"""
+        salt = record.get("salt")
+        return DatabaseManager.verify_hash(
+            bytes.fromhex(salt) if salt is not None else None,
+            bytes.fromhex(record["password"]),
+            password
+        )
     
     @staticmethod
     def create_user(username, password, level="user"):
@@ -78,9 +256,11 @@ class DatabaseManager:
         if username in users:
             return False, "Username sudah terdaftar"
         
+        salt, password_hash = DatabaseManager.make_password(password)
         users[username] = {
-            "password": DatabaseManager.hash_password(password),
-            "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "salt": salt,
+            "password": password_hash,
+            "created": _now_str(),
             "level": level,
             "last_login": None
         }
@@ -90,26 +270,65 @@ class DatabaseManager:
     
     @staticmethod
     def update_last_login(username):
-        """Update waktu login terakhir"""
+        """Update waktu login terakhir, mengembalikan record user (atau None)"""
         users = DatabaseManager.load_users()
         if username in users:
-            users[username]["last_login"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            record = users[username]
+            record["last_login"] = _now_str()
             DatabaseManager.save_users(users)
+            return record
+        return None
+    
+    @staticmethod
+    def upgrade_legacy_hash(username, password):
+        """Ganti hash SHA-256 lama (tanpa salt) dengan PBKDF2 bersalt"""
+        users = DatabaseManager.load_users()
+        record = users.get(username)
+        if record is None or "salt" in record:
+            return False
+        record["salt"], record["password"] = DatabaseManager.make_password(password)
+        DatabaseManager.save_users(users)
+        return True
 
 # ======================
 # LOGGER CLASS
 # ======================
+class Events:
+    """Jenis event untuk log (sudah huruf besar)"""
+    LOGIN = "LOGIN"
+    LOGOUT = "LOGOUT"
+
 class Logger:
     """Mencatat aktivitas sistem"""
     
+    # Handle log yang tetap terbuka selama program berjalan
+    _fh = None
+    
+    @staticmethod
+    def _get_handle():
+        """Membuka handle log sekali saja (lazy)"""
+        if Logger._fh is None:
+            Logger._fh = open(Config.LOG_FILE, 'a', buffering=8192)
+            atexit.register(Logger.close)
+        return Logger._fh
+    
+    @staticmethod
+    def close():
+        """Flush dan tutup handle log"""
+        if Logger._fh is not None:
+            Logger._fh.close()
+            Logger._fh = None
+    
     @staticmethod
     def log_event(event_type, username, status, details=""):
-        """Mencatat event ke log file"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {event_type.upper()} | User: {username} | Status: {status} | {details}\n"
-        
-        with open(Config.LOG_FILE, 'a') as f:
-            f.write(log_entry)
+        """Mencatat event ke log file (event_type dari Events)"""
+        fh = Logger._get_handle()
+        fh.write(
+            "[" + _now_str() + "] " + event_type + " | User: " + username
+            + " | Status: " + status + " | " + details + "\n"
+        )
+        # Flush tiap event agar log tetap tersimpan jika proses dihentikan
+        fh.flush()
     
     @staticmethod
     def show_logs(limit=10):
@@ -117,10 +336,22 @@ class Logger:
         if not os.path.exists(Config.LOG_FILE):
             return "Log file tidak ditemukan"
         
-        with open(Config.LOG_FILE, 'r') as f:
-            lines = f.readlines()
+        # Baca dari akhir file saja, perbesar jendela jika baris kurang
+        size = os.path.getsize(Config.LOG_FILE)
+        window = 8192
+        with open(Config.LOG_FILE, 'rb') as f:
+            while True:
+                start = max(0, size - window)
+                f.seek(start)
+                lines = f.read().decode('utf-8', 'replace').splitlines()
+                if start > 0:
+                    # Baris pertama kemungkinan terpotong
+                    lines = lines[1:]
+                if len(lines) >= limit or start == 0:
+                    break
+                window *= 2
         
-        return "".join(lines[-limit:])
+        return "".join(line + "\n" for line in lines[-limit:])
 
 # ======================
 # UI HELPER CLASS
@@ -131,45 +362,67 @@ class UIHelper:
     @staticmethod
     def clear_screen():
         """Membersihkan layar terminal"""
-        os.system('clear' if os.name != 'nt' else 'cls')
+        if _CLEAR is None:
+            os.system('cls')
+            return
+        sys.stdout.write(_CLEAR)
+        sys.stdout.flush()
     
     @staticmethod
     def print_color(text, color):
         """Mencetak teks dengan warna"""
-        color_code = Config.COLORS.get(color.upper(), Config.COLORS['RESET'])
-        print(f"{color_code}{text}{Config.COLORS['RESET']}")
+        color_code = _COLORS.get(color)
+        if color_code is None:
+            color_code = _COLORS.get(color.upper(), _RESET)
+        sys.stdout.write(color_code + str(text) + _RESET + '\n')
+    
+    @staticmethod
+    def _header_parts(title):
+        """Bagian-bagian header (termasuk escape clear screen jika ada)"""
+        parts = [] if _CLEAR is None else [_CLEAR]
+        parts += [_HR50, '\n', _COLORS['CYAN'], '    ', title, _RESET, '\n', _HR50, '\n']
+        return parts
     
     @staticmethod
     def print_header(title):
         """Mencetak header yang terstruktur"""
-        UIHelper.clear_screen()
-        print("=" * 50)
-        UIHelper.print_color(f"    {title}", "CYAN")
-        print("=" * 50)
+        if _CLEAR is None:
+            UIHelper.clear_screen()
+        sys.stdout.write(''.join(UIHelper._header_parts(title)))
+        sys.stdout.flush()
     
     @staticmethod
     def print_menu(title, options):
         """Menampilkan menu dengan pilihan"""
-        UIHelper.print_header(title)
-        for i, (key, desc) in enumerate(options.items(), 1):
-            print(f"  {i}. {desc}")
-        print("=" * 50)
+        if _CLEAR is None:
+            UIHelper.clear_screen()
+        parts = UIHelper._header_parts(title)
+        for i, desc in enumerate(options.values(), 1):
+            parts.append(f"  {i}. {desc}\n")
+        parts += [_HR50, '\n']
+        sys.stdout.write(''.join(parts))
+        sys.stdout.flush()
     
     @staticmethod
     def get_input(prompt, password=False):
         """Mendapatkan input dari pengguna"""
         if password:
+            import getpass
             return getpass.getpass(prompt)
         return input(prompt).strip()
     
     @staticmethod
-    def loading_animation(text="Loading", duration=1):
+    def loading_animation(text="Loading", duration=0.9):
         """Animasi loading sederhana"""
-        for i in range(3):
-            sys.stdout.write(f"\r{text}{'.' * (i+1)}")
+        if not Config.SHOW_ANIMATIONS or not sys.stdout.isatty():
+            return
+        
+        step = duration / 3
+        for dots in ('.', '..', '...'):
+            sys.stdout.write('\r' + text + dots)
             sys.stdout.flush()
-            time.sleep(0.3)
-        print()
+            time.sleep(step)
+        sys.stdout.write('\n')
 
 # ======================
 # AUTHENTICATION CLASS
@@ -178,8 +431,8 @@ class Authentication:
     """Mengelola proses autentikasi"""
     
     def __init__(self):
-        self.users = DatabaseManager.load_users()
         self.attempts = {}
+        self.user_level = None  # Level user yang terakhir berhasil login
     
     def login(self):
         """Proses login utama"""
@@ -203,8 +456,10 @@ class Authentication:
         
         if user:
             self.attempts.pop(username, None)  # Reset attempts
-            DatabaseManager.update_last_login(username)
-            Logger.log_event("LOGIN", username, "SUCCESS")
+            DatabaseManager.upgrade_legacy_hash(username, password)
+            record = DatabaseManager.update_last_login(username)
+            self.user_level = (record or {}).get("level", "user")
+            Logger.log_event(Events.LOGIN, username, "SUCCESS")
             UIHelper.print_color("\nLogin berhasil!", "GREEN")
             time.sleep(1)
             return username
@@ -214,18 +469,14 @@ class Authentication:
             self.attempts[username] = current_attempts
             remaining = Config.MAX_ATTEMPTS - current_attempts
             
-            Logger.log_event("LOGIN", username, "FAILED", f"Attempt {current_attempts}")
+            Logger.log_event(Events.LOGIN, username, "FAILED", f"Attempt {current_attempts}")
             UIHelper.print_color(f"\nLogin gagal! Sisa percobaan: {remaining}", "RED")
             time.sleep(2)
             return None
     
     def _verify_credentials(self, username, password):
         """Memverifikasi username dan password"""
-        if username in self.users:
-            stored_hash = self.users[username]["password"]
-            input_hash = DatabaseManager.hash_password(password)
-            return stored_hash == input_hash
-        return False
+        return DatabaseManager.verify_user(username, password)
     
     def _is_user_locked(self, username):
         """Cek apakah user dikunci karena terlalu banyak attempt"""
@@ -244,25 +495,54 @@ class Authentication:
 class MenuSystem:
     """Sistem menu aplikasi"""
     
-    def __init__(self, username):
+    # Perintah shell untuk menu System Info
+    SYSTEM_INFO_COMMANDS = {
+        1: 'uname -a',
+        2: 'df -h',
+        3: 'free -m',
+        4: 'ps aux | head -20'
+    }
+    
+    # Menu File Operations: (prompt input atau None, template perintah)
+    FILE_COMMANDS = {
+        1: (None, 'ls -la'),
+        2: ("Nama direktori: ", 'mkdir {}'),
+        3: ("Nama file: ", 'rm -i {}'),
+        4: ("Nama file: ", 'cat {}')
+    }
+    
+    def __init__(self, username, user_level):
         self.username = username
-        self.users = DatabaseManager.load_users()
-        self.user_level = self.users.get(username, {}).get("level", "user")
+        self.user_level = user_level
+        
+        is_admin = self.user_level == "admin"
+        self._main_options = {
+            1: "System Information",
+            2: "File Operations",
+            3: "Network Tools",
+            4: "Package Manager",
+            5: "User Management" if is_admin else "Change Password",
+            6: "View Logs" if is_admin else "About",
+            0: "Logout"
+        }
+        self._main_dispatch = {
+            1: self.system_info,
+            2: self.file_operations,
+            3: self.network_tools,
+            4: self.package_manager,
+            5: self.user_management if is_admin else self.change_password,
+            6: self.view_logs if is_admin else self.about
+        }
+        self._user_dispatch = {
+            1: self.create_user,
+            2: self.list_users,
+            3: self.delete_user
+        }
     
     def main_menu(self):
         """Menu utama aplikasi"""
         while True:
-            options = {
-                1: "System Information",
-                2: "File Operations",
-                3: "Network Tools",
-                4: "Package Manager",
-                5: "User Management" if self.user_level == "admin" else "Change Password",
-                6: "View Logs" if self.user_level == "admin" else "About",
-                0: "Logout"
-            }
-            
-            UIHelper.print_menu("MAIN MENU", options)
+            UIHelper.print_menu("MAIN MENU", self._main_options)
             
             try:
                 choice = int(UIHelper.get_input("Pilih menu [0-6]: "))
@@ -274,27 +554,13 @@ class MenuSystem:
             if choice == 0:
                 self.logout()
                 break
-            elif choice == 1:
-                self.system_info()
-            elif choice == 2:
-                self.file_operations()
-            elif choice == 3:
-                self.network_tools()
-            elif choice == 4:
-                self.package_manager()
-            elif choice == 5:
-                if self.user_level == "admin":
-                    self.user_management()
-                else:
-                    self.change_password()
-            elif choice == 6:
-                if self.user_level == "admin":
-                    self.view_logs()
-                else:
-                    self.about()
-            else:
+            
+            handler = self._main_dispatch.get(choice)
+            if handler is None:
                 UIHelper.print_color("Pilihan tidak tersedia!", "YELLOW")
                 time.sleep(1)
+            else:
+                handler()
     
     def system_info(self):
         """Menu informasi sistem"""
@@ -316,17 +582,13 @@ class MenuSystem:
             except ValueError:
                 continue
             
-            if choice == 1:
-                os.system('uname -a')
-            elif choice == 2:
-                os.system('df -h')
-            elif choice == 3:
-                os.system('free -m')
-            elif choice == 4:
-                os.system('ps aux | head -20')
-            elif choice == 5:
+            if choice == 5:
                 break
             
+            command = self.SYSTEM_INFO_COMMANDS.get(choice)
+            if command is not None:
+                os.system(command)
+            
             input("\nTekan Enter untuk lanjut...")
     
     def file_operations(self):
@@ -349,20 +611,16 @@ class MenuSystem:
             except ValueError:
                 continue
             
-            if choice == 1:
-                os.system('ls -la')
-            elif choice == 2:
-                dir_name = UIHelper.get_input("Nama direktori: ")
-                os.system(f'mkdir {dir_name}')
-            elif choice == 3:
-                file_name = UIHelper.get_input("Nama file: ")
-                os.system(f'rm -i {file_name}')
-            elif choice == 4:
-                file_name = UIHelper.get_input("Nama file: ")
-                os.system(f'cat {file_name}')
-            elif choice == 5:
+            if choice == 5:
                 break
             
+            entry = self.FILE_COMMANDS.get(choice)
+            if entry is not None:
+                prompt, command = entry
+                if prompt is not None:
+                    command = command.format(UIHelper.get_input(prompt))
+                os.system(command)
+            
             input("\nTekan Enter...")
     
     def network_tools(self):
@@ -421,14 +679,12 @@ class MenuSystem:
             except ValueError:
                 continue
             
-            if choice == 1:
-                self.create_user()
-            elif choice == 2:
-                self.list_users()
-            elif choice == 3:
-                self.delete_user()
-            elif choice == 4:
+            if choice == 4:
                 break
+            
+            handler = self._user_dispatch.get(choice)
+            if handler is not None:
+                handler()
     
     def create_user(self):
         """Membuat user baru"""
@@ -449,12 +705,18 @@ class MenuSystem:
         """Menampilkan daftar user"""
         users = DatabaseManager.load_users()
         
-        print("\n" + "=" * 60)
-        print(f"{'USERNAME':<20} {'LEVEL':<10} {'CREATED':<20}")
-        print("=" * 60)
-        
-        for username, data in users.items():
-            print(f"{username:<20} {data.get('level','user'):<10} {data.get('created',''):<20}")
+        lines = [
+            "",
+            _HR60,
+            f"{'USERNAME':<20} {'LEVEL':<10} {'CREATED':<20}",
+            _HR60
+        ]
+        lines.extend(
+            f"{username:<20} {data.get('level','user'):<10} {data.get('created',''):<20}"
+            for username, data in users.items()
+        )
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
         
         input("\nTekan Enter...")
     
@@ -488,7 +750,7 @@ class MenuSystem:
         
         users = DatabaseManager.load_users()
         
-        if DatabaseManager.hash_password(old_pass) != users[self.username]["password"]:
+        if not DatabaseManager.verify_password(users[self.username], old_pass):
             UIHelper.print_color("Password lama salah!", "RED")
             time.sleep(2)
             return
@@ -498,7 +760,9 @@ class MenuSystem:
             time.sleep(2)
             return
         
-        users[self.username]["password"] = DatabaseManager.hash_password(new_pass)
+        salt, password_hash = DatabaseManager.make_password(new_pass)
+        users[self.username]["salt"] = salt
+        users[self.username]["password"] = password_hash
         DatabaseManager.save_users(users)
         
         UIHelper.print_color("Password berhasil diubah!", "GREEN")
@@ -525,7 +789,7 @@ class MenuSystem:
     
     def logout(self):
         """Proses logout"""
-        Logger.log_event("LOGOUT", self.username, "SUCCESS")
+        Logger.log_event(Events.LOGOUT, self.username, "SUCCESS")
         UIHelper.print_color("Logout berhasil!", "GREEN")
         time.sleep(1)
 
@@ -548,7 +812,7 @@ class TermuxApp:
             
             if username:
                 # Inisialisasi menu system
-                menu_system = MenuSystem(username)
+                menu_system = MenuSystem(username, self.auth.user_level)
                 menu_system.main_menu()
             else:
                 retry = UIHelper.get_input("\nCoba lagi? (y/n): ").lower()
@@ -561,7 +825,7 @@ class TermuxApp:
         """Inisialisasi sistem"""
         # Pastikan file database ada
         if not os.path.exists(Config.DB_FILE):
-            DatabaseManager.save_users(DatabaseManager.load_users())
+            DatabaseManager.save_users(DatabaseManager.default_users())
             UIHelper.print_color("Database initialized", "GREEN")
 
 # ======================